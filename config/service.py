@@ -5,12 +5,14 @@ from enum import Enum
 
 from dotenv import load_dotenv
 
-from game_ai import RandomSelection, StrategicAI
 from game_engine import StandardGameEngine
 from storage import InMemoryGameStorage
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Load environment variables from .env file if it exists (once per process,
+# including child processes that inherit the environment)
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
 
 class Environment(str, Enum):
@@ -22,6 +24,15 @@ class Environment(str, Enum):
     TESTING = "testing"
 
 
+# Resolve the ENVIRONMENT variable once at import time
+_ENV_STR = os.getenv("ENVIRONMENT", "development").lower()
+_ENV = (
+    Environment(_ENV_STR)
+    if _ENV_STR in Environment._value2member_map_
+    else Environment.DEVELOPMENT
+)
+
+
 class ConfigService:
     """Service for managing application configuration and dependencies."""
 
@@ -30,16 +41,10 @@ class ConfigService:
 
         Args:
             environment: The environment to use. If None, will be determined from
-                        the ENVIRONMENT environment variable or default to DEVELOPMENT.
+                        the ENVIRONMENT environment variable (read once at import)
+                        or default to DEVELOPMENT.
         """
-        if environment is None:
-            env_str = os.getenv("ENVIRONMENT", "development").lower()
-            try:
-                self.environment = Environment(env_str)
-            except ValueError:
-                self.environment = Environment.DEVELOPMENT
-        else:
-            self.environment = environment
+        self.environment = _ENV if environment is None else environment
 
         # Initialize dependencies
         self._storage = None
@@ -115,8 +120,13 @@ class ConfigService:
         # Determine AI type from environment variable or default
         ai_type = os.getenv("AI_TYPE", "strategic").lower()
 
+        # Deferred until an AI is first requested
         if ai_type == "random":
+            from game_ai.random_selection import RandomSelection
+
             return RandomSelection(engine)
         else:
+            from game_ai.strategic import StrategicAI
+
             return StrategicAI(engine)
 
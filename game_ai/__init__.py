@@ -1,8 +1,33 @@
 """Game AI package."""
 
+from importlib import import_module
+
 from game_ai.game_ai import GameAI
-from game_ai.random_selection import RandomSelection
-from game_ai.strategic import StrategicAI
+from models.board import INDEX_POSITION as VALID_POSITIONS
+
+__all__ = ["GameAI", "RandomSelection", "StrategicAI", "VALID_POSITIONS"]
+
+# AI implementations are imported on first access, so loading one submodule
+# (as ConfigService does) does not pull in the others
+_LAZY_AIS = {
+    "RandomSelection": "game_ai.random_selection",
+    "StrategicAI": "game_ai.strategic",
+}
+
+
+def __getattr__(name: str):
+    """Import an AI implementation on first access.
+
+    Args:
+        name: The attribute being looked up.
 
-__all__ = ["GameAI", "RandomSelection", "StrategicAI"]
+    Returns:
+        The requested AI class.
 
+    Raises:
+        AttributeError: If name is not an AI exported by this package.
+    """
+    module = _LAZY_AIS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
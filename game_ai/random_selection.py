@@ -3,6 +3,7 @@
 import random
 from uuid import UUID
 
+from models.board import INDEX_POSITION
 from models.game import Game
 
 from game_ai.game_ai import GameAI
@@ -12,12 +13,8 @@ from game_engine import StandardGameEngine
 class RandomSelection(GameAI):
     """AI that selects a random unoccupied square."""
 
-    # Valid board positions: A1-A3, B1-B3, C1-C3
-    VALID_POSITIONS = [
-        "A1", "A2", "A3",
-        "B1", "B2", "B3",
-        "C1", "C2", "C3",
-    ]
+    # Valid board positions: A1-A3, B1-B3, C1-C3 (shared, row-major order)
+    VALID_POSITIONS = INDEX_POSITION
 
     def __init__(self, engine: StandardGameEngine | None = None) -> None:
         """Initialize the random selection AI.
@@ -40,11 +37,12 @@ class RandomSelection(GameAI):
         Raises:
             ValueError: If no valid moves are available.
         """
-        # Get all valid moves
+        # Get all valid moves from a single board snapshot
+        board = self._engine.get_board_state(game)
         valid_moves = [
             position
-            for position in self.VALID_POSITIONS
-            if self._engine.is_valid_move(game, position)
+            for position, cell in zip(self.VALID_POSITIONS, (cell for row in board for cell in row))
+            if cell is None
         ]
 
         if not valid_moves:
@@ -1,10 +1,9 @@
 """Strategic AI implementation."""
 
-from copy import deepcopy
 from uuid import UUID
 
-from models.game import Game
-from models.move import Move
+from models.board import INDEX_POSITION
+from models.game import Game, GameStatus
 
 from game_ai.game_ai import GameAI
 from game_engine import StandardGameEngine
@@ -13,17 +12,17 @@ from game_engine import StandardGameEngine
 class StrategicAI(GameAI):
     """AI that follows a strategic priority: block, center, corners, sides."""
 
-    # Valid board positions: A1-A3, B1-B3, C1-C3
-    VALID_POSITIONS = [
-        "A1", "A2", "A3",
-        "B1", "B2", "B3",
-        "C1", "C2", "C3",
-    ]
+    # Valid board positions: A1-A3, B1-B3, C1-C3 (shared, row-major order)
+    VALID_POSITIONS = INDEX_POSITION
 
     # Priority order: center, corners, sides
     CENTER = "B2"
     CORNERS = ["A1", "A3", "C1", "C3"]
     SIDES = ["A2", "B1", "B3", "C2"]
+    POSITIONAL_PRIORITY = (CENTER, *CORNERS, *SIDES)
+
+    # Fewest pieces one player needs on the board to be one move from a win
+    MIN_PIECES_FOR_THREAT = 2
 
     def __init__(self, engine: StandardGameEngine | None = None) -> None:
         """Initialize the strategic AI.
@@ -33,21 +32,6 @@ class StrategicAI(GameAI):
         """
         self._engine = engine or StandardGameEngine()
 
-    def _get_opponent_uuid(self, game: Game, player_uuid: UUID) -> UUID | None:
-        """Get the opponent's UUID.
-
-        Args:
-            game: The current game state.
-            player_uuid: The current player's UUID.
-
-        Returns:
-            The opponent's UUID, or None if not found.
-        """
-        for player in game.players:
-            if player.uuid != player_uuid:
-                return player.uuid
-        return None
-
     def _would_win(self, game: Game, player_uuid: UUID, position: str) -> bool:
         """Check if a move would result in a win for the player.
 
@@ -59,19 +43,12 @@ class StrategicAI(GameAI):
         Returns:
             True if the move would result in a win, False otherwise.
         """
-        # Create a copy of the game with the hypothetical move
-        game_copy = deepcopy(game)
-        next_order = len(game_copy.moves) + 1
-        hypothetical_move = Move(
-            position=position,
-            player=player_uuid,
-            order=next_order
+        return self._engine.with_hypothetical_move(
+            game,
+            position,
+            player_uuid,
+            lambda g: self._engine.check_game_status(g) == GameStatus.WIN,
         )
-        game_copy.moves.append(hypothetical_move)
-
-        # Check if this would result in a win
-        status = self._engine.check_game_status(game_copy)
-        return status.value == "Win"
 
     def get_next_move(self, game: Game, player_uuid: UUID) -> str:
         """Get the next move following strategic priorities.
@@ -93,44 +70,43 @@ class StrategicAI(GameAI):
         Raises:
             ValueError: If no valid moves are available.
         """
-        # Get all valid moves
+        # Get all valid moves from a single board snapshot
+        board = self._engine.get_board_state(game)
         valid_moves = [
             position
-            for position in self.VALID_POSITIONS
-            if self._engine.is_valid_move(game, position)
+            for position, cell in zip(self.VALID_POSITIONS, (cell for row in board for cell in row))
+            if cell is None
         ]
 
         if not valid_moves:
             raise ValueError("No valid moves available")
 
-        # Get opponent UUID
-        opponent_uuid = self._get_opponent_uuid(game, player_uuid)
-
-        # Priority 0: Win if possible
-        for position in valid_moves:
-            if self._would_win(game, player_uuid, position):
-                return position
+        # Get opponent UUID once up front (None if not found)
+        opponent_uuid = next(
+            (player.uuid for player in game.players if player.uuid != player_uuid),
+            None,
+        )
 
-        # Priority 1: Block opponent from winning
-        if opponent_uuid:
+        # Nobody can be one move from three in a row until some player has two
+        # pieces down, so the win/block probes are skipped until then. Counted
+        # per piece because turn order is not enforced
+        x_bb, o_bb = game.sync_bitboards()
+        if max(x_bb.bit_count(), o_bb.bit_count()) >= self.MIN_PIECES_FOR_THREAT:
+            # Priority 0: Win if possible
             for position in valid_moves:
-                if self._would_win(game, opponent_uuid, position):
+                if self._would_win(game, player_uuid, position):
                     return position
 
-        # Priority 2: Take center if available
-        if self.CENTER in valid_moves:
-            return self.CENTER
-
-        # Priority 3: Take corners (in order)
-        for corner in self.CORNERS:
-            if corner in valid_moves:
-                return corner
-
-        # Priority 4: Take sides (in order)
-        for side in self.SIDES:
-            if side in valid_moves:
-                return side
-
-        # Fallback (should not reach here if valid_moves is not empty)
-        return valid_moves[0]
-
+            # Priority 1: Block opponent from winning
+            if opponent_uuid:
+                for position in valid_moves:
+                    if self._would_win(game, opponent_uuid, position):
+                        return position
+
+        # Priority 2-4: Take center, then corners, then sides (in order)
+        available = set(valid_moves)
+        return next(
+            (position for position in self.POSITIONAL_PRIORITY if position in available),
+            # Fallback (should not reach here if valid_moves is not empty)
+            valid_moves[0],
+        )
@@ -2,6 +2,7 @@
 
 from game_engine.game_engine import GameEngine
 from game_engine.standard import StandardGameEngine
+from game_engine.transposition import SHARED_TRANSPOSITIONS, TranspositionTable
 
-__all__ = ["GameEngine", "StandardGameEngine"]
+__all__ = ["GameEngine", "SHARED_TRANSPOSITIONS", "StandardGameEngine", "TranspositionTable"]
 
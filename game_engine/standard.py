@@ -1,11 +1,72 @@
 """Standard game engine implementation."""
 
+from collections.abc import Callable
+from typing import Final, TypeVar
 from uuid import UUID
 
+from models.board import FULL_BOARD, POSITION_LOOKUP, has_win
 from models.game import Game, GameStatus
+from models.move import Move
 from models.player import Piece
 
 from game_engine.game_engine import GameEngine
+from game_engine.transposition import SHARED_TRANSPOSITIONS, TranspositionTable
+
+T = TypeVar("T")
+
+# Statuses after which no further moves can change the outcome
+_TERMINAL_STATUSES = (GameStatus.WIN, GameStatus.DRAW)
+
+# Integer status codes returned by _check_status, and the GameStatus for each
+STATUS_ONGOING: Final = 0
+STATUS_WIN: Final = 1
+STATUS_DRAW: Final = 2
+_STATUS_BY_CODE: Final = (GameStatus.ONGOING, GameStatus.WIN, GameStatus.DRAW)
+
+# Piece and display symbol for each flat board cell code (EMPTY, X_CELL, O_CELL)
+CELL_PIECES = (None, Piece.X.value, Piece.O.value)
+CELL_SYMBOLS = (" ", Piece.X.value, Piece.O.value)
+
+# Full format_game_output layout; cells {0}-{8} are in bitboard order
+_OUTPUT_TEMPLATE = (
+    "Tic-Tac-Toe Game\n"
+    "====================\n"
+    "\n"
+    "    1   2   3\n"
+    "  ┌───┬───┬───┐\n"
+    "A │ {0} │ {1} │ {2} │\n"
+    "  ├───┼───┼───┤\n"
+    "B │ {3} │ {4} │ {5} │\n"
+    "  ├───┼───┼───┤\n"
+    "C │ {6} │ {7} │ {8} │\n"
+    "  └───┴───┴───┘\n"
+    "\n"
+    "Status: {status}\n"
+    "{winner_line}"
+    "Moves made: {moves}"
+)
+
+
+def _check_status(x_bb: int, o_bb: int) -> int:
+    """Evaluate a position from its bitboards alone.
+
+    Pure integer logic with no object access, so it stays cheap to call from
+    a search loop.
+
+    Args:
+        x_bb: Bitboard of X's cells.
+        o_bb: Bitboard of O's cells.
+
+    Returns:
+        STATUS_WIN, STATUS_DRAW, or STATUS_ONGOING.
+    """
+    # A win is a lookup per piece in the precomputed win table;
+    # otherwise a full board (all nine bits set) is a draw
+    if has_win(x_bb) or has_win(o_bb):
+        return STATUS_WIN
+    if (x_bb | o_bb) == FULL_BOARD:
+        return STATUS_DRAW
+    return STATUS_ONGOING
 
 
 class StandardGameEngine(GameEngine):
@@ -18,27 +79,16 @@ class StandardGameEngine(GameEngine):
         "C1": (2, 0), "C2": (2, 1), "C3": (2, 2),
     }
 
-    def _parse_position(self, position: str) -> tuple[int, int] | None:
-        """Parse a position string (e.g., 'A1') into row, column indices.
+    def __init__(self, transposition_table: TranspositionTable | None = None) -> None:
+        """Initialize the standard game engine.
 
         Args:
-            position: The position string.
-
-        Returns:
-            Tuple of (row, column) indices, or None if invalid.
-        """
-        return self.VALID_POSITIONS.get(position.upper())
-
-    def _get_player_piece_map(self, game: Game) -> dict[UUID, str]:
-        """Create a mapping from player UUID to piece symbol.
-
-        Args:
-            game: The game to get player mappings from.
-
-        Returns:
-            Dictionary mapping player UUID to "X" or "O".
+            transposition_table: Optional table for memoizing position statuses.
+                If not provided, the process-wide SHARED_TRANSPOSITIONS is used.
         """
-        return {player.uuid: player.piece.value for player in game.players}
+        self._transpositions = (
+            SHARED_TRANSPOSITIONS if transposition_table is None else transposition_table
+        )
 
     def get_board_state(self, game: Game) -> list[list[str | None]]:
         """Get representation of the current 3x3 tic-tac-toe board.
@@ -49,23 +99,8 @@ class StandardGameEngine(GameEngine):
         Returns:
             A 3x3 matrix representing the board.
         """
-        # Initialize empty board
-        board: list[list[str | None]] = [[None, None, None] for _ in range(3)]
-
-        # Create player UUID to piece mapping
-        player_piece_map = self._get_player_piece_map(game)
-
-        # Apply moves to board (sorted by order to ensure correct sequence)
-        sorted_moves = sorted(game.moves, key=lambda m: m.order)
-        for move in sorted_moves:
-            coords = self._parse_position(move.position)
-            if coords:
-                row, col = coords
-                piece = player_piece_map.get(move.player)
-                if piece:
-                    board[row][col] = piece
-
-        return board
+        flat = game.flat_board()
+        return [[CELL_PIECES[code] for code in flat[row * 3:row * 3 + 3]] for row in range(3)]
 
     def is_valid_move(self, game: Game, position: str) -> bool:
         """Check if a move is valid.
@@ -77,15 +112,12 @@ class StandardGameEngine(GameEngine):
         Returns:
             True if the move is valid, False otherwise.
         """
-        # Check if position is valid format
-        coords = self._parse_position(position)
-        if coords is None:
+        # Check if position is valid format, then whether it is already occupied
+        index = POSITION_LOOKUP.get(position)
+        if index is None:
             return False
-
-        # Check if position is already occupied
-        board = self.get_board_state(game)
-        row, col = coords
-        return board[row][col] is None
+        x_bb, o_bb = game.sync_bitboards()
+        return not ((x_bb | o_bb) >> index) & 1
 
     def check_game_status(self, game: Game) -> GameStatus:
         """Check the current game status.
@@ -96,49 +128,60 @@ class StandardGameEngine(GameEngine):
         Returns:
             The current game status (WIN, DRAW, or ONGOING).
         """
-        board = self.get_board_state(game)
-        player_piece_map = self._get_player_piece_map(game)
-
-        # Check for wins
-        # Check rows
-        for row in board:
-            if row[0] is not None and row[0] == row[1] == row[2]:
-                # Find the winning player UUID
-                winning_piece = row[0]
-                for player_uuid, piece in player_piece_map.items():
-                    if piece == winning_piece:
-                        return GameStatus.WIN
-
-        # Check columns
-        for col in range(3):
-            if board[0][col] is not None and board[0][col] == board[1][col] == board[2][col]:
-                winning_piece = board[0][col]
-                for player_uuid, piece in player_piece_map.items():
-                    if piece == winning_piece:
-                        return GameStatus.WIN
-
-        # Check diagonals
-        # Top-left to bottom-right
-        if board[0][0] is not None and board[0][0] == board[1][1] == board[2][2]:
-            winning_piece = board[0][0]
-            for player_uuid, piece in player_piece_map.items():
-                if piece == winning_piece:
-                    return GameStatus.WIN
-
-        # Top-right to bottom-left
-        if board[0][2] is not None and board[0][2] == board[1][1] == board[2][0]:
-            winning_piece = board[0][2]
-            for player_uuid, piece in player_piece_map.items():
-                if piece == winning_piece:
-                    return GameStatus.WIN
-
-        # Check for draw (board full, no winner)
-        is_board_full = all(board[row][col] is not None for row in range(3) for col in range(3))
-        if is_board_full:
-            return GameStatus.DRAW
-
-        # Otherwise, game is ongoing
-        return GameStatus.ONGOING
+        # Wins and draws are final, so a finished game needs no re-evaluation
+        if game.status in _TERMINAL_STATUSES:
+            return game.status
+
+        # Three in a row needs at least three moves, so skip building bitboards
+        if len(game.moves) < 3:
+            return GameStatus.ONGOING
+
+        # Positions are memoized by the exact board (both bitboards in 18 bits),
+        # so transposed move orders reaching the same board are evaluated once
+        # and distinct boards can never share an entry
+        x_bb, o_bb = game.sync_bitboards()
+        key = x_bb | o_bb << 9
+        status = self._transpositions.get(key)
+        if status is None:
+            status = _STATUS_BY_CODE[_check_status(x_bb, o_bb)]
+            self._transpositions[key] = status
+        return status
+
+    def with_hypothetical_move(
+        self,
+        game: Game,
+        position: str,
+        player_uuid: UUID,
+        fn: Callable[[Game], T],
+    ) -> T:
+        """Evaluate a function with a move temporarily played on the game.
+
+        The move is appended to the end of the game's moves, ``fn`` is called,
+        and the move is popped again (even if ``fn`` raises), so no copy of the
+        game is needed.
+
+        Args:
+            game: The game to play the move on.
+            position: The board position (must be a valid, empty position).
+            player_uuid: The UUID of the player making the move.
+            fn: Function to evaluate against the game with the move applied.
+
+        Returns:
+            The result of ``fn``.
+        """
+        move = Move(
+            position=position,
+            player=player_uuid,
+            order=len(game.moves) + 1,
+        )
+        # Append rather than add_move: with gaps in the move orders, inserting by
+        # order could land mid-list and pop_move would remove a real move
+        game.moves.append(move)
+        game.sync_bitboards()
+        try:
+            return fn(game)
+        finally:
+            game.pop_move()
 
     def format_game_output(self, game: Game) -> str:
         """Format game state for user-friendly CLI output.
@@ -149,38 +192,19 @@ class StandardGameEngine(GameEngine):
         Returns:
             A formatted string representation of the game state.
         """
-        board = self.get_board_state(game)
-        lines = []
-
-        # Header
-        lines.append("Tic-Tac-Toe Game")
-        lines.append("=" * 20)
-        lines.append("")
-
-        # Board representation
-        lines.append("    1   2   3")
-        lines.append("  ┌───┬───┬───┐")
-        for row_idx, row in enumerate(board):
-            row_label = chr(ord("A") + row_idx)  # A, B, C
-            cells = [cell if cell else " " for cell in row]
-            lines.append(f"{row_label} │ {cells[0]} │ {cells[1]} │ {cells[2]} │")
-            if row_idx < 2:
-                lines.append("  ├───┼───┼───┤")
-        lines.append("  └───┴───┴───┘")
-        lines.append("")
-
-        # Game status
+        flat = game.flat_board()
         status = self.check_game_status(game)
-        lines.append(f"Status: {status.value}")
 
         # Show winner if game is won
+        winner_line = ""
         if status == GameStatus.WIN and game.winner:
-            player_piece_map = self._get_player_piece_map(game)
-            winning_piece = player_piece_map.get(game.winner, "?")
-            lines.append(f"Winner: {winning_piece}")
-
-        # Move count
-        lines.append(f"Moves made: {len(game.moves)}")
-
-        return "\n".join(lines)
+            winning_piece = game.piece_of(game.winner)
+            winner_line = f"Winner: {winning_piece.value if winning_piece else '?'}\n"
+
+        return _OUTPUT_TEMPLATE.format(
+            *(CELL_SYMBOLS[code] for code in flat),
+            status=status.value,
+            winner_line=winner_line,
+            moves=len(game.moves),
+        )
 
@@ -0,0 +1,14 @@
+"""Transposition table for memoizing position evaluations."""
+
+from models.game import GameStatus
+
+# Maps an exact board (X bitboard | O bitboard << 9) to its status. Different
+# move orders that reach the same board share one entry. There are at most
+# 2**18 keys, so the table needs no eviction, and a single dict get or set is
+# atomic, so it needs no lock.
+TranspositionTable = dict[int, GameStatus]
+
+# Process-wide table used by engines that are not given their own. Keys are
+# exact boards and statuses are a pure function of the board, so sharing is
+# always safe.
+SHARED_TRANSPOSITIONS: TranspositionTable = {}
@@ -0,0 +1,56 @@
+"""Board geometry shared by the game models and engine."""
+
+import random
+from typing import Final
+
+# Board positions in bitboard order (bit index = row * 3 + col)
+INDEX_POSITION: Final[tuple[str, ...]] = ("A1", "A2", "A3", "B1", "B2", "B3", "C1", "C2", "C3")
+POSITION_INDEX: Final[dict[str, int]] = {position: index for index, position in enumerate(INDEX_POSITION)}
+
+# Case-insensitive position -> index lookup ("A1" and "a1" both map to 0), so
+# parsing a position is one dict lookup with no str.upper() allocation
+POSITION_LOOKUP: Final[dict[str, int]] = {
+    **POSITION_INDEX,
+    **{position.lower(): index for position, index in POSITION_INDEX.items()},
+}
+
+# Bitboard with every cell occupied
+FULL_BOARD: Final = 0x1FF
+
+# Flat board cell codes, as returned by Game.flat_board
+EMPTY: Final = 0
+X_CELL: Final = 1
+O_CELL: Final = 2
+
+# Winning lines as bitboard masks: 3 rows, 3 columns, 2 diagonals
+WIN_MASKS: Final[tuple[int, ...]] = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100,
+)
+
+# Bit b is set iff the 9-bit board b contains at least one winning line, so a
+# win check is a single shift and mask instead of a loop over WIN_MASKS
+WIN_LUT: Final[int] = sum(
+    1 << board
+    for board in range(1 << 9)
+    if any((board & mask) == mask for mask in WIN_MASKS)
+)
+
+
+def has_win(bb: int) -> bool:
+    """Check whether a bitboard contains three in a row.
+
+    Args:
+        bb: Bitboard of one piece's cells.
+
+    Returns:
+        True if any row, column, or diagonal is complete, False otherwise.
+    """
+    return bool((WIN_LUT >> bb) & 1)
+
+
+# Zobrist keys, one per (cell, piece) pair at index cell * 2 + piece (X=0, O=1).
+# Seeded so hashes are reproducible across runs.
+_zobrist_rng = random.Random(0xC0FFEE)
+ZOBRIST_KEYS: Final[tuple[int, ...]] = tuple(_zobrist_rng.getrandbits(64) for _ in range(18))
@@ -1,12 +1,14 @@
 """Game model for tic-tac-toe game."""
 
+from bisect import insort
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 from uuid import UUID
 
-from pydantic import BaseModel, Field
-
+from models.board import EMPTY, O_CELL, X_CELL, ZOBRIST_KEYS
 from models.move import Move
-from models.player import Player
+from models.player import Piece, Player
 
 
 class GameStatus(str, Enum):
@@ -17,12 +19,183 @@ class GameStatus(str, Enum):
     ONGOING = "Ongoing"
 
 
-class Game(BaseModel):
+@dataclass(slots=True)
+class Game:
     """Game model."""
 
-    uuid: UUID = Field(..., description="Unique identifier for the game")
-    status: GameStatus = Field(..., description="Current status of the game")
-    moves: list[Move] = Field(default_factory=list, description="List of moves made in the game")
-    players: list[Player] = Field(..., description="List of players in the game")
-    winner: UUID | None = Field(None, description="UUID of the winning player, or None if no winner")
+    uuid: UUID  # Unique identifier for the game
+    status: GameStatus  # Current status of the game
+    players: list[Player]  # List of players in the game
+    moves: list[Move] = field(default_factory=list)  # List of moves made in the game, in play order
+    winner: UUID | None = None  # UUID of the winning player, or None if no winner
+
+    # Derived from moves by sync_bitboards, so excluded from __init__ and __eq__
+    # Bitboard of cells occupied by X (bit index = row * 3 + col)
+    x_bb: int = field(default=0, init=False, repr=False, compare=False)
+    # Bitboard of cells occupied by O (bit index = row * 3 + col)
+    o_bb: int = field(default=0, init=False, repr=False, compare=False)
+    # Zobrist hash of the board position
+    zobrist: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Flat board snapshot cached by flat_board once the game has ended; cleared
+    # whenever moves change
+    _board_cache: bytes | None = field(default=None, init=False, repr=False, compare=False)
+    # The moves already folded into the bitboards, as they stood at the last sync
+    _synced: list[Move] = field(default_factory=list, init=False, repr=False, compare=False)
+    # Player UUID -> piece, built on first use (players never change mid-game)
+    _pieces: dict[UUID, Piece] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Coerce plain string UUIDs, rejecting invalid ones."""
+        if not isinstance(self.uuid, UUID):
+            self.uuid = UUID(self.uuid)
+        if self.winner is not None and not isinstance(self.winner, UUID):
+            self.winner = UUID(self.winner)
+
+    def piece_of(self, player_uuid: UUID) -> Piece | None:
+        """Get the piece assigned to a player.
+
+        Args:
+            player_uuid: The UUID of the player.
+
+        Returns:
+            The player's piece, or None if the player is not in this game.
+        """
+        if self._pieces is None:
+            self._pieces = {player.uuid: player.piece for player in self.players}
+        return self._pieces.get(player_uuid)
+
+    def _apply_move(self, move: Move, undo: bool = False) -> None:
+        """Place (or, with undo, remove) a move's piece on the bitboards and hash.
+
+        Args:
+            move: The move to apply.
+            undo: Whether to remove the move instead of placing it.
+        """
+        self._board_cache = None
+        index = move.index
+        piece = self.piece_of(move.player)
+        if index is None or piece is None:
+            return
+
+        bit = 1 << index
+        if piece is Piece.X:
+            self.x_bb = self.x_bb & ~bit if undo else self.x_bb | bit
+        elif piece is Piece.O:
+            self.o_bb = self.o_bb & ~bit if undo else self.o_bb | bit
+        self.zobrist ^= ZOBRIST_KEYS[index * 2 + (piece is Piece.O)]
+
+    def sync_bitboards(self) -> tuple[int, int]:
+        """Fold any moves appended since the last sync into the bitboards.
+
+        Normally moves are only appended, so only the new tail of the move list
+        is applied. If the previously synced moves are no longer the leading
+        moves of the list (it was shrunk, inserted into, or had an element
+        replaced), the bitboards are rebuilt from scratch. The Zobrist hash is
+        kept in step with the bitboards.
+
+        Returns:
+            Tuple of (X bitboard, O bitboard).
+        """
+        synced = self._synced
+        moves = self.moves
+        # Identity checks over at most nine moves, so cheap on every call
+        if len(synced) > len(moves) or any(
+            old is not new for old, new in zip(synced, moves)
+        ):
+            self.x_bb = 0
+            self.o_bb = 0
+            self.zobrist = 0
+            self._board_cache = None
+            synced.clear()
+
+        for move in moves[len(synced):]:
+            self._apply_move(move)
+            synced.append(move)
+
+        return self.x_bb, self.o_bb
+
+    def flat_board(self) -> bytes:
+        """Get the board as a flat buffer of nine cell codes.
+
+        Returns:
+            Nine bytes indexed by row * 3 + col, each EMPTY, X_CELL, or O_CELL.
+        """
+        # Sync first: folding in new moves clears any cached board
+        x_bb, o_bb = self.sync_bitboards()
+        if self._board_cache is not None:
+            return self._board_cache
+
+        flat = bytes(
+            X_CELL if (x_bb >> index) & 1 else O_CELL if (o_bb >> index) & 1 else EMPTY
+            for index in range(9)
+        )
+
+        # A finished game's board can no longer change, so decode it only once
+        if self.status in (GameStatus.WIN, GameStatus.DRAW):
+            self._board_cache = flat
+        return flat
+
+    def add_move(self, move: Move) -> None:
+        """Insert a move in play order and fold it into the bitboards.
+
+        Keeping the list sorted on insertion means readers never need to sort
+        it; in normal play the move simply lands at the end.
+
+        Args:
+            move: The move to add.
+        """
+        self.sync_bitboards()
+        insort(self.moves, move, key=lambda m: m.order)
+        self._apply_move(move)
+        self._synced[:] = self.moves
+
+    def replay_moves(self, positions: Sequence[str], first_player: int = 0) -> None:
+        """Append a sequence of moves played alternately by the two players.
+
+        Intended for bulk loading a game log from its positions alone. Every
+        move is built and checked before any is added, so a rejected log
+        leaves the game unchanged.
+
+        Args:
+            positions: Board positions in play order (e.g., ["A1", "B2"]).
+            first_player: Index into players (0 or 1) of whoever plays the
+                first position.
+
+        Raises:
+            ValueError: If first_player is not 0 or 1, a position is not on the
+                board or already occupied, or the log would exceed nine moves.
+        """
+        if first_player not in (0, 1):
+            raise ValueError(f"first_player must be 0 or 1, got {first_player}")
+
+        x_bb, o_bb = self.sync_bitboards()
+        occupied = x_bb | o_bb
+        start = len(self.moves)
+        movers = (self.players[first_player].uuid, self.players[1 - first_player].uuid)
+        new_moves = []
+        for i, position in enumerate(positions):
+            move = Move(position=position, player=movers[i % 2], order=start + i + 1)
+            if move.index is None:
+                raise ValueError(f"Invalid position: {position}")
+            if (occupied >> move.index) & 1:
+                raise ValueError(f"Position already occupied: {position}")
+            occupied |= 1 << move.index
+            new_moves.append(move)
+
+        for move in new_moves:
+            self._apply_move(move)
+        self.moves.extend(new_moves)
+        self._synced.extend(new_moves)
+
+    def pop_move(self) -> Move:
+        """Remove the last move, clearing it from the bitboards and hash.
 
+        Returns:
+            The removed move.
+        """
+        self.sync_bitboards()
+        move = self.moves.pop()
+        self._apply_move(move, undo=True)
+        self._synced.pop()
+        return move
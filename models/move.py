@@ -1,14 +1,29 @@
 """Move model for tic-tac-toe game."""
 
+from dataclasses import dataclass, field
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from models.board import INDEX_POSITION, POSITION_LOOKUP
 
 
-class Move(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Move:
     """Move model."""
 
-    position: str = Field(..., description="Board position (e.g., A1, A2, B2, C3)")
-    player: UUID = Field(..., description="UUID of the player who made the move")
-    order: int = Field(..., ge=1, le=9, description="Move order number (1-9)")
+    position: str  # Board position (e.g., A1, A2, B2, C3)
+    player: UUID  # UUID of the player who made the move
+    order: int  # Move order number (1-9)
+    # Bitboard index of the position (row * 3 + col), or None if not on the board
+    index: int | None = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        """Validate the move, coerce the player UUID, and resolve the bitboard index."""
+        if not 1 <= self.order <= 9:
+            raise ValueError(f"Move order must be between 1 and 9, got {self.order}")
+        if not isinstance(self.player, UUID):
+            object.__setattr__(self, "player", UUID(self.player))
+        index = POSITION_LOOKUP.get(self.position)
+        object.__setattr__(self, "index", index)
+        # Share the canonical position string instead of keeping a per-move copy
+        if index is not None:
+            object.__setattr__(self, "position", INDEX_POSITION[index])
@@ -1,10 +1,9 @@
 """Player model for tic-tac-toe game."""
 
+from dataclasses import dataclass
 from enum import Enum
 from uuid import UUID
 
-from pydantic import BaseModel, Field
-
 
 class PlayerType(str, Enum):
     """Player type enumeration."""
@@ -20,10 +19,17 @@ class Piece(str, Enum):
     O = "O"
 
 
-class Player(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Player:
     """Player model."""
 
-    uuid: UUID = Field(..., description="Unique identifier for the player")
-    type: PlayerType = Field(..., description="Type of player (computer or human)")
-    piece: Piece = Field(..., description="Game piece assigned to the player (X or O)")
+    uuid: UUID  # Unique identifier for the player
+    type: PlayerType  # Type of player (computer or human)
+    piece: Piece  # Game piece assigned to the player (X or O)
 
+    def __post_init__(self) -> None:
+        """Coerce plain string values to a UUID and enums, rejecting invalid ones."""
+        if not isinstance(self.uuid, UUID):
+            object.__setattr__(self, "uuid", UUID(self.uuid))
+        object.__setattr__(self, "type", PlayerType(self.type))
+        object.__setattr__(self, "piece", Piece(self.piece))
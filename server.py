@@ -127,47 +127,49 @@ def add_move(game_uuid: str, player_uuid: str, position: str) -> dict:
     if not game:
         return {"error": f"Game {game_uuid} not found"}
 
+    # Normalize once; is_valid_move accepts either case
+    position = position.upper()
+
     # Validate move
     if not engine.is_valid_move(game, position):
         return {"error": f"Invalid move: {position} is not a valid or available position"}
 
-    # Create move
+    # Create move, referencing the game's own player UUID so moves share it
+    # rather than each holding a freshly parsed copy
+    player_id = UUID(player_uuid)
+    player_id = next((p.uuid for p in game.players if p.uuid == player_id), player_id)
     next_order = len(game.moves) + 1
     move = Move(
-        position=position.upper(),
-        player=UUID(player_uuid),
+        position=position,
+        player=player_id,
         order=next_order,
     )
 
-    # Add move to game
-    game.moves.append(move)
+    # Add move to the stored game (moves are kept in order; nothing downstream
+    # re-sorts them)
+    game = storage.append_move(game.uuid, move)
+    assert move.order == len(game.moves), "moves must be appended in order"
 
     # Update game status
     game.status = engine.check_game_status(game)
 
-    # Update winner if game is won
+    # Update winner if game is won (the move that completed the line wins)
     if game.status == GameStatus.WIN:
-        # Find the winning player
-        board = engine.get_board_state(game)
-        player_piece_map = {p.uuid: p.piece.value for p in game.players}
-        # Check who won by looking at the board
-        # (The engine already determined there's a winner)
-        # We'll set the winner based on the last move
-        game.winner = UUID(player_uuid)
-
-    # Save game
+        game.winner = player_id
+
+    # Save updated status and winner
     storage.write_game(game)
 
     return {
         "game_uuid": game_uuid,
         "move": {
-            "position": position.upper(),
+            "position": position,
             "player_uuid": player_uuid,
             "order": next_order,
         },
         "status": game.status.value,
         "winner": str(game.winner) if game.winner else None,
-        "message": f"Move added: {position.upper()}",
+        "message": f"Move added: {position}",
     }
 
 
@@ -204,7 +206,7 @@ def get_game_state(game_uuid: str) -> dict:
                 "player_uuid": str(m.player),
                 "order": m.order,
             }
-            for m in sorted(game.moves, key=lambda m: m.order)
+            for m in game.moves
         ],
     }
 
@@ -232,8 +234,7 @@ def check_game_status(game_uuid: str) -> dict:
             # Determine winner from board state
             # The last move that resulted in a win is the winner
             if game.moves:
-                last_move = sorted(game.moves, key=lambda m: m.order)[-1]
-                game.winner = last_move.player
+                game.winner = game.moves[-1].player
         storage.write_game(game)
 
     return {
@@ -258,8 +259,6 @@ def list_moves(game_uuid: str) -> dict:
     if not game:
         return {"error": f"Game {game_uuid} not found"}
 
-    sorted_moves = sorted(game.moves, key=lambda m: m.order)
-
     return {
         "game_uuid": game_uuid,
         "moves": [
@@ -268,7 +267,7 @@ def list_moves(game_uuid: str) -> dict:
                 "position": m.position,
                 "player_uuid": str(m.player),
             }
-            for m in sorted_moves
+            for m in game.moves
         ],
     }
 
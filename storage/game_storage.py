@@ -4,11 +4,14 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from models.game import Game
+from models.move import Move
 
 
 class GameStorage(ABC):
     """Abstract interface for game storage implementations."""
 
+    __slots__ = ()
+
     @abstractmethod
     def write_game(self, game: Game) -> None:
         """Write a game to storage.
@@ -30,3 +33,15 @@ class GameStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def append_move(self, game_uuid: UUID, move: Move) -> Game | None:
+        """Append a move to a stored game.
+
+        Args:
+            game_uuid: The UUID of the game to update.
+            move: The move to append.
+
+        Returns:
+            The updated game if found, None otherwise.
+        """
+        pass
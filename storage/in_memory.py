@@ -1,18 +1,40 @@
 """In-memory game storage implementation."""
 
+from collections import OrderedDict
 from uuid import UUID
 
 from models.game import Game
+from models.move import Move
 
 from storage.game_storage import GameStorage
 
 
 class InMemoryGameStorage(GameStorage):
-    """In-memory implementation of game storage."""
+    """In-memory implementation of game storage.
 
-    def __init__(self) -> None:
-        """Initialize the in-memory storage."""
-        self._games: dict[UUID, Game] = {}
+    Games live in a flat list indexed by a small integer slot, and a side index
+    translates UUIDs to slots at the API boundary. Games are kept in
+    least-recently-used order and the oldest game is evicted once the capacity
+    is exceeded, so memory stays bounded in long-running servers. Evicted slots
+    are reused by later games.
+    """
+
+    __slots__ = ("_games", "_slots", "_free_slots", "_capacity")
+
+    DEFAULT_CAPACITY = 10_000
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize the in-memory storage.
+
+        Args:
+            capacity: Maximum number of games to keep before evicting the least
+                recently used one.
+        """
+        self._games: list[Game | None] = []
+        # UUID.int -> slot in _games, in least-recently-used order
+        self._slots: OrderedDict[int, int] = OrderedDict()
+        self._free_slots: list[int] = []
+        self._capacity = capacity
 
     def write_game(self, game: Game) -> None:
         """Write a game to in-memory storage.
@@ -20,7 +42,25 @@ class InMemoryGameStorage(GameStorage):
         Args:
             game: The game to store.
         """
-        self._games[game.uuid] = game
+        key = game.uuid.int
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._games[slot] = game
+            self._slots.move_to_end(key)
+            return
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._games[slot] = game
+        else:
+            slot = len(self._games)
+            self._games.append(game)
+        self._slots[key] = slot
+
+        if len(self._slots) > self._capacity:
+            _, evicted = self._slots.popitem(last=False)
+            self._games[evicted] = None
+            self._free_slots.append(evicted)
 
     def read_game(self, game_uuid: UUID) -> Game | None:
         """Read a game from in-memory storage.
@@ -31,5 +71,27 @@ class InMemoryGameStorage(GameStorage):
         Returns:
             The game if found, None otherwise.
         """
-        return self._games.get(game_uuid)
+        key = game_uuid.int
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        self._slots.move_to_end(key)
+        return self._games[slot]
+
+    def append_move(self, game_uuid: UUID, move: Move) -> Game | None:
+        """Append a move to a game in in-memory storage.
 
+        The stored game is updated in place, so its bitboards and Zobrist hash
+        are maintained incrementally rather than recomputed.
+
+        Args:
+            game_uuid: The UUID of the game to update.
+            move: The move to append.
+
+        Returns:
+            The updated game if found, None otherwise.
+        """
+        game = self.read_game(game_uuid)
+        if game is not None:
+            game.add_move(move)
+        return game
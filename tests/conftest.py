@@ -0,0 +1,13 @@
+"""Shared pytest fixtures."""
+
+import random
+from uuid import UUID
+
+import pytest
+
+
+@pytest.fixture
+def uuid_factory():
+    """Create a factory for deterministic UUIDs (no urandom syscall per UUID)."""
+    rng = random.Random(0)
+    return lambda: UUID(int=rng.getrandbits(128))
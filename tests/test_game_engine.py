@@ -1,35 +1,34 @@
 """Unit tests for StandardGameEngine."""
 
 import pytest
-from uuid import uuid4
 
 from game_engine import StandardGameEngine
 from models import Game, GameStatus, Move, Player, PlayerType, Piece
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def engine():
-    """Create a StandardGameEngine instance."""
+    """Create a StandardGameEngine instance shared by all tests."""
     return StandardGameEngine()
 
 
 @pytest.fixture
-def player1():
+def player1(uuid_factory):
     """Create player 1 (X)."""
-    return Player(uuid=uuid4(), type=PlayerType.HUMAN, piece=Piece.X)
+    return Player(uuid=uuid_factory(), type=PlayerType.HUMAN, piece=Piece.X)
 
 
 @pytest.fixture
-def player2():
+def player2(uuid_factory):
     """Create player 2 (O)."""
-    return Player(uuid=uuid4(), type=PlayerType.COMPUTER, piece=Piece.O)
+    return Player(uuid=uuid_factory(), type=PlayerType.COMPUTER, piece=Piece.O)
 
 
 @pytest.fixture
-def empty_game(player1, player2):
+def empty_game(player1, player2, uuid_factory):
     """Create an empty game."""
     return Game(
-        uuid=uuid4(),
+        uuid=uuid_factory(),
         status=GameStatus.ONGOING,
         moves=[],
         players=[player1, player2],
@@ -71,6 +70,22 @@ class TestGetBoardState:
         assert board[1][1] == "O"  # B2
         assert board[2][2] == "X"  # C3
 
+    def test_string_piece_is_coerced(self, engine, uuid_factory):
+        """Test that a player created with a plain string piece plays that piece."""
+        player = Player(uuid=uuid_factory(), type="human", piece="X")
+        game = Game(uuid=uuid_factory(), status=GameStatus.ONGOING, players=[player])
+        game.moves.append(Move(position="A1", player=player.uuid, order=1))
+
+        assert player.piece is Piece.X
+        assert engine.get_board_state(game)[0][0] == "X"
+
+    def test_string_player_uuid_is_coerced(self, engine, empty_game, player1):
+        """Test that a move made with a string player UUID is placed on the board."""
+        empty_game.moves.append(Move(position="A1", player=str(player1.uuid), order=1))
+
+        assert empty_game.moves[0].player == player1.uuid
+        assert engine.get_board_state(empty_game)[0][0] == "X"
+
     def test_board_preserves_move_order(self, engine, empty_game, player1, player2):
         """Test that moves are applied in order."""
         # Add moves out of order
@@ -87,6 +102,15 @@ class TestGetBoardState:
         assert board[1][1] == "O"  # B2
         assert board[2][2] == "X"  # C3
 
+    def test_finished_game_board_refreshes_after_new_move(self, engine, empty_game, player1):
+        """Test that a cached board for a finished game is dropped when moves change."""
+        empty_game.moves.append(Move(position="A1", player=player1.uuid, order=1))
+        empty_game.status = GameStatus.WIN
+        assert engine.get_board_state(empty_game)[0][0] == "X"
+
+        empty_game.moves.append(Move(position="C3", player=player1.uuid, order=2))
+        assert engine.get_board_state(empty_game)[2][2] == "X"
+
 
 class TestIsValidMove:
     """Tests for is_valid_move method."""
@@ -112,6 +136,15 @@ class TestIsValidMove:
         assert engine.is_valid_move(empty_game, "B2") is False
         assert engine.is_valid_move(empty_game, "A1") is True  # Still valid
 
+    def test_moves_added_after_previous_check(self, engine, empty_game, player1, player2):
+        """Test that moves appended after a check are picked up."""
+        empty_game.moves.append(Move(position="A1", player=player1.uuid, order=1))
+        assert engine.is_valid_move(empty_game, "A1") is False
+
+        empty_game.moves.append(Move(position="B2", player=player2.uuid, order=2))
+        assert engine.is_valid_move(empty_game, "B2") is False
+        assert engine.is_valid_move(empty_game, "C3") is True
+
     def test_case_insensitive_position(self, engine, empty_game):
         """Test that position parsing is case-insensitive."""
         assert engine.is_valid_move(empty_game, "a1") is True
@@ -138,77 +171,68 @@ class TestCheckGameStatus:
         status = engine.check_game_status(empty_game)
         assert status == GameStatus.ONGOING
 
-    def test_win_horizontal_row_a(self, engine, empty_game, player1):
-        """Test horizontal win in row A."""
-        moves = [
-            Move(position="A1", player=player1.uuid, order=1),
-            Move(position="A2", player=player1.uuid, order=2),
-            Move(position="A3", player=player1.uuid, order=3),
-        ]
-        empty_game.moves.extend(moves)
-
-        status = engine.check_game_status(empty_game)
-        assert status == GameStatus.WIN
-
-    def test_win_horizontal_row_b(self, engine, empty_game, player2):
-        """Test horizontal win in row B."""
-        moves = [
-            Move(position="B1", player=player2.uuid, order=1),
-            Move(position="B2", player=player2.uuid, order=2),
-            Move(position="B3", player=player2.uuid, order=3),
-        ]
-        empty_game.moves.extend(moves)
+    @pytest.mark.parametrize(
+        ("positions", "player_fixture"),
+        [
+            (["A1", "A2", "A3"], "player1"),  # Horizontal, row A
+            (["B1", "B2", "B3"], "player2"),  # Horizontal, row B
+            (["A1", "B1", "C1"], "player1"),  # Vertical, column 1
+            (["A2", "B2", "C2"], "player2"),  # Vertical, column 2
+            (["A1", "B2", "C3"], "player1"),  # Diagonal, A1-B2-C3
+            (["A3", "B2", "C1"], "player2"),  # Diagonal, A3-B2-C1
+        ],
+        ids=["row_a", "row_b", "column_1", "column_2", "diagonal_a1_c3", "diagonal_a3_c1"],
+    )
+    def test_win_lines(self, request, engine, empty_game, positions, player_fixture):
+        """Test wins along rows, columns, and diagonals."""
+        player = request.getfixturevalue(player_fixture)
+        for order, position in enumerate(positions, start=1):
+            empty_game.moves.append(Move(position=position, player=player.uuid, order=order))
 
         status = engine.check_game_status(empty_game)
         assert status == GameStatus.WIN
 
-    def test_win_vertical_column_1(self, engine, empty_game, player1):
-        """Test vertical win in column 1."""
+    def test_mixed_line_is_not_win(self, engine, empty_game, player1, player2):
+        """Test that a full row shared by both players is not a win."""
         moves = [
             Move(position="A1", player=player1.uuid, order=1),
-            Move(position="B1", player=player1.uuid, order=2),
-            Move(position="C1", player=player1.uuid, order=3),
-        ]
-        empty_game.moves.extend(moves)
-
-        status = engine.check_game_status(empty_game)
-        assert status == GameStatus.WIN
-
-    def test_win_vertical_column_2(self, engine, empty_game, player2):
-        """Test vertical win in column 2."""
-        moves = [
-            Move(position="A2", player=player2.uuid, order=1),
-            Move(position="B2", player=player2.uuid, order=2),
-            Move(position="C2", player=player2.uuid, order=3),
+            Move(position="A2", player=player2.uuid, order=2),
+            Move(position="A3", player=player1.uuid, order=3),
         ]
         empty_game.moves.extend(moves)
 
         status = engine.check_game_status(empty_game)
-        assert status == GameStatus.WIN
+        assert status == GameStatus.ONGOING
 
-    def test_win_diagonal_top_left_to_bottom_right(self, engine, empty_game, player1):
-        """Test diagonal win from A1-B2-C3."""
-        moves = [
+    def test_move_inserted_after_previous_check(self, engine, empty_game, player1, player2):
+        """Test that a move inserted mid-list after a check is picked up."""
+        empty_game.moves.extend([
             Move(position="A1", player=player1.uuid, order=1),
-            Move(position="B2", player=player1.uuid, order=2),
-            Move(position="C3", player=player1.uuid, order=3),
+            Move(position="B1", player=player2.uuid, order=2),
+            Move(position="A3", player=player1.uuid, order=5),
+        ])
+        assert engine.check_game_status(empty_game) == GameStatus.ONGOING
+
+        empty_game.moves.insert(2, Move(position="A2", player=player1.uuid, order=3))
+        assert engine.check_game_status(empty_game) == GameStatus.WIN
+        assert engine.get_board_state(empty_game)[0] == ["X", "X", "X"]
+
+    def test_repeated_cell_does_not_affect_other_games(
+        self, engine, empty_game, player1, player2, uuid_factory
+    ):
+        """Test that a game with a repeated cell cannot poison another game's status."""
+        positions = [
+            ("A1", player1), ("B1", player2), ("A2", player1), ("B2", player2), ("A3", player1),
         ]
-        empty_game.moves.extend(moves)
+        for order, (position, player) in enumerate(positions, start=1):
+            empty_game.add_move(Move(position=position, player=player.uuid, order=order))
+        empty_game.add_move(Move(position="A3", player=player1.uuid, order=6))
+        assert engine.check_game_status(empty_game) == GameStatus.WIN
 
-        status = engine.check_game_status(empty_game)
-        assert status == GameStatus.WIN
-
-    def test_win_diagonal_top_right_to_bottom_left(self, engine, empty_game, player2):
-        """Test diagonal win from A3-B2-C1."""
-        moves = [
-            Move(position="A3", player=player2.uuid, order=1),
-            Move(position="B2", player=player2.uuid, order=2),
-            Move(position="C1", player=player2.uuid, order=3),
-        ]
-        empty_game.moves.extend(moves)
-
-        status = engine.check_game_status(empty_game)
-        assert status == GameStatus.WIN
+        other = Game(uuid=uuid_factory(), status=GameStatus.ONGOING, players=[player1, player2])
+        for order, (position, player) in enumerate(positions[:4], start=1):
+            other.add_move(Move(position=position, player=player.uuid, order=order))
+        assert engine.check_game_status(other) == GameStatus.ONGOING
 
     def test_draw_full_board_no_winner(self, engine, empty_game, player1, player2):
         """Test draw when board is full with no winner."""
@@ -313,3 +337,109 @@ class TestFormatGameOutput:
         assert "Status: Draw" in output
         assert "Moves made: 9" in output
 
+
+class TestWithHypotheticalMove:
+    """Tests for with_hypothetical_move method."""
+
+    def test_move_applied_during_call(self, engine, empty_game, player1):
+        """Test that the move is visible to the function and removed afterwards."""
+        board = engine.with_hypothetical_move(
+            empty_game, "B2", player1.uuid, engine.get_board_state
+        )
+        assert board[1][1] == "X"
+        assert empty_game.moves == []
+
+    def test_move_removed_when_function_raises(self, engine, empty_game, player1):
+        """Test that the move is popped even if the function raises."""
+        def fail(game):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            engine.with_hypothetical_move(empty_game, "B2", player1.uuid, fail)
+        assert empty_game.moves == []
+
+    def test_move_removed_with_gaps_in_move_orders(self, engine, empty_game, player1, player2):
+        """Test that only the probe is removed when existing move orders are not contiguous."""
+        moves = [
+            Move(position="A1", player=player1.uuid, order=1),
+            Move(position="C3", player=player2.uuid, order=5),
+        ]
+        empty_game.moves.extend(moves)
+
+        board = engine.with_hypothetical_move(
+            empty_game, "B2", player1.uuid, engine.get_board_state
+        )
+        assert board[1][1] == "X"
+        assert empty_game.moves == moves
+        assert engine.get_board_state(empty_game)[1][1] is None
+        assert engine.get_board_state(empty_game)[2][2] == "O"
+
+
+class TestGame:
+    """Tests for Game move bookkeeping."""
+
+    def test_equality_ignores_derived_bitboards(self, engine, empty_game, player1, player2):
+        """Test that syncing one of two identical games does not make them unequal."""
+        move = Move(position="A1", player=player1.uuid, order=1)
+        empty_game.moves.append(move)
+        other = Game(
+            uuid=empty_game.uuid,
+            status=GameStatus.ONGOING,
+            players=[player1, player2],
+            moves=[move],
+        )
+
+        assert not engine.is_valid_move(empty_game, "A1")
+        assert empty_game == other
+
+    def test_add_move_keeps_play_order(self, engine, empty_game, player1, player2):
+        """Test that add_move inserts moves by order and updates the board."""
+        empty_game.add_move(Move(position="C3", player=player1.uuid, order=3))
+        empty_game.add_move(Move(position="A1", player=player1.uuid, order=1))
+        empty_game.add_move(Move(position="B2", player=player2.uuid, order=2))
+
+        assert [move.order for move in empty_game.moves] == [1, 2, 3]
+        board = engine.get_board_state(empty_game)
+        assert board[0][0] == "X"  # A1
+        assert board[1][1] == "O"  # B2
+        assert board[2][2] == "X"  # C3
+
+    def test_replay_moves_matches_individual_moves(self, engine, empty_game, player1, player2):
+        """Test that bulk-replayed moves build the same board as adding them one by one."""
+        positions = ["B2", "A1", "C3", "A3", "A2", "C2", "B1", "B3", "C1"]
+        replayed = Game(
+            uuid=empty_game.uuid,
+            status=GameStatus.ONGOING,
+            players=[player1, player2],
+        )
+        replayed.replay_moves(positions)
+
+        for order, position in enumerate(positions, start=1):
+            player = player1 if order % 2 else player2
+            empty_game.add_move(Move(position=position, player=player.uuid, order=order))
+
+        assert replayed.moves == empty_game.moves
+        assert engine.get_board_state(replayed) == engine.get_board_state(empty_game)
+        assert replayed.zobrist == empty_game.zobrist
+
+    def test_replay_moves_rejects_invalid_first_player(self, empty_game):
+        """Test that replay_moves only accepts player index 0 or 1."""
+        with pytest.raises(ValueError):
+            empty_game.replay_moves(["A1"], first_player=2)
+        assert empty_game.moves == []
+
+    @pytest.mark.parametrize(
+        "positions",
+        [
+            ["A1", "A2", "A3", "B1", "B2", "B3", "C1", "C2", "C3", "A1"],
+            ["A1", "B2", "A1"],
+            ["A1", "D4"],
+        ],
+        ids=["ten-moves", "repeated-cell", "off-board"],
+    )
+    def test_replay_moves_rejects_invalid_log(self, engine, empty_game, positions):
+        """Test that an invalid log is rejected without changing the game."""
+        with pytest.raises(ValueError):
+            empty_game.replay_moves(positions)
+        assert empty_game.moves == []
+        assert engine.get_board_state(empty_game) == [[None] * 3] * 3
@@ -0,0 +1,98 @@
+"""Unit tests for InMemoryGameStorage."""
+
+import pytest
+
+from models import Game, GameStatus, Move, Player, PlayerType, Piece
+from storage import InMemoryGameStorage
+
+
+@pytest.fixture
+def player(uuid_factory):
+    """Create a player (X)."""
+    return Player(uuid=uuid_factory(), type=PlayerType.HUMAN, piece=Piece.X)
+
+
+@pytest.fixture
+def make_game(player, uuid_factory):
+    """Create a factory for empty games."""
+    return lambda: Game(uuid=uuid_factory(), status=GameStatus.ONGOING, players=[player])
+
+
+class TestInMemoryGameStorage:
+    """Tests for InMemoryGameStorage."""
+
+    def test_read_written_game(self, make_game):
+        """Test that a written game can be read back by UUID."""
+        storage = InMemoryGameStorage()
+        game = make_game()
+        storage.write_game(game)
+
+        assert storage.read_game(game.uuid) is game
+
+    def test_read_missing_game(self, uuid_factory):
+        """Test that reading an unknown UUID returns None."""
+        storage = InMemoryGameStorage()
+        assert storage.read_game(uuid_factory()) is None
+
+    def test_evicts_least_recently_used_at_capacity(self, make_game):
+        """Test that the oldest game is evicted once capacity is exceeded."""
+        storage = InMemoryGameStorage(capacity=2)
+        first, second, third = make_game(), make_game(), make_game()
+        for game in (first, second, third):
+            storage.write_game(game)
+
+        assert storage.read_game(first.uuid) is None
+        assert storage.read_game(second.uuid) is second
+        assert storage.read_game(third.uuid) is third
+
+    def test_read_refreshes_recency(self, make_game):
+        """Test that reading a game protects it from the next eviction."""
+        storage = InMemoryGameStorage(capacity=2)
+        first, second, third = make_game(), make_game(), make_game()
+        storage.write_game(first)
+        storage.write_game(second)
+        storage.read_game(first.uuid)
+        storage.write_game(third)
+
+        assert storage.read_game(first.uuid) is first
+        assert storage.read_game(second.uuid) is None
+
+    def test_rewrite_does_not_grow_storage(self, make_game):
+        """Test that writing the same game again replaces it in place."""
+        storage = InMemoryGameStorage(capacity=2)
+        first, second = make_game(), make_game()
+        storage.write_game(first)
+        storage.write_game(second)
+        storage.write_game(first)
+
+        assert storage.read_game(first.uuid) is first
+        assert storage.read_game(second.uuid) is second
+
+    def test_evicted_slot_is_reused(self, make_game):
+        """Test that a new game takes over an evicted game's slot."""
+        storage = InMemoryGameStorage(capacity=2)
+        games = [make_game() for _ in range(5)]
+        for game in games:
+            storage.write_game(game)
+
+        assert len(storage._games) == 3
+        stored = [storage.read_game(game.uuid) for game in games]
+        assert stored == [None, None, None, games[3], games[4]]
+
+    def test_append_move(self, make_game, player):
+        """Test that append_move updates the stored game in place."""
+        storage = InMemoryGameStorage()
+        game = make_game()
+        storage.write_game(game)
+        move = Move(position="B2", player=player.uuid, order=1)
+
+        assert storage.append_move(game.uuid, move) is game
+        assert game.moves == [move]
+        assert game.x_bb == 1 << 4
+
+    def test_append_move_to_missing_game(self, uuid_factory, player):
+        """Test that appending to an unknown UUID returns None."""
+        storage = InMemoryGameStorage()
+        move = Move(position="B2", player=player.uuid, order=1)
+
+        assert storage.append_move(uuid_factory(), move) is None
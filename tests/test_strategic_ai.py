@@ -0,0 +1,40 @@
+"""Unit tests for StrategicAI."""
+
+import pytest
+
+from game_ai import StrategicAI
+from models import Game, GameStatus, Move, Player, PlayerType, Piece
+
+
+@pytest.fixture
+def player1(uuid_factory):
+    """Create player 1 (X)."""
+    return Player(uuid=uuid_factory(), type=PlayerType.HUMAN, piece=Piece.X)
+
+
+@pytest.fixture
+def player2(uuid_factory):
+    """Create player 2 (O)."""
+    return Player(uuid=uuid_factory(), type=PlayerType.COMPUTER, piece=Piece.O)
+
+
+@pytest.fixture
+def empty_game(player1, player2, uuid_factory):
+    """Create an empty game."""
+    return Game(uuid=uuid_factory(), status=GameStatus.ONGOING, players=[player1, player2])
+
+
+class TestGetNextMove:
+    """Tests for get_next_move method."""
+
+    def test_takes_center_on_empty_board(self, empty_game, player2):
+        """Test that the center is taken first when there is nothing to block."""
+        assert StrategicAI().get_next_move(empty_game, player2.uuid) == "B2"
+
+    def test_blocks_after_two_moves_by_one_player(self, empty_game, player1, player2):
+        """Test that a threat is blocked even when turns did not alternate."""
+        empty_game.moves.extend([
+            Move(position="A1", player=player1.uuid, order=1),
+            Move(position="A2", player=player1.uuid, order=2),
+        ])
+        assert StrategicAI().get_next_move(empty_game, player2.uuid) == "A3"
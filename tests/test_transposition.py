@@ -0,0 +1,51 @@
+"""Unit tests for the transposition table."""
+
+import pytest
+
+from game_engine import SHARED_TRANSPOSITIONS, StandardGameEngine, TranspositionTable
+from models import Game, GameStatus, Move, Player, PlayerType, Piece
+
+
+@pytest.fixture
+def player1(uuid_factory):
+    """Create player 1 (X)."""
+    return Player(uuid=uuid_factory(), type=PlayerType.HUMAN, piece=Piece.X)
+
+
+@pytest.fixture
+def player2(uuid_factory):
+    """Create player 2 (O)."""
+    return Player(uuid=uuid_factory(), type=PlayerType.COMPUTER, piece=Piece.O)
+
+
+class TestTranspositionTable:
+    """Tests for the transposition table used by StandardGameEngine."""
+
+    def test_engines_share_default_table(self):
+        """Test that engines built without a table share SHARED_TRANSPOSITIONS."""
+        first, second = StandardGameEngine(), StandardGameEngine()
+        assert first._transpositions is SHARED_TRANSPOSITIONS
+        assert second._transpositions is SHARED_TRANSPOSITIONS
+
+    def test_status_stored_under_exact_board(self, player1, player2, uuid_factory):
+        """Test that a status is memoized under X bitboard | O bitboard << 9."""
+        table: TranspositionTable = {}
+        engine = StandardGameEngine(table)
+        game = Game(uuid=uuid_factory(), status=GameStatus.ONGOING, players=[player1, player2])
+        for order, position in enumerate(["A1", "B1", "A2", "B2", "A3"], start=1):
+            player = player1 if order % 2 else player2
+            game.moves.append(Move(position=position, player=player.uuid, order=order))
+
+        assert engine.check_game_status(game) == GameStatus.WIN
+        assert table == {0b000000111 | 0b000011000 << 9: GameStatus.WIN}
+
+    def test_stored_status_is_reused(self, player1, player2, uuid_factory):
+        """Test that a board already in the table is answered from it."""
+        game = Game(uuid=uuid_factory(), status=GameStatus.ONGOING, players=[player1, player2])
+        for order, position in enumerate(["A1", "B1", "C1"], start=1):
+            player = player1 if order % 2 else player2
+            game.moves.append(Move(position=position, player=player.uuid, order=order))
+        # X on A1 and C1, O on B1; ONGOING really, so the stored DRAW must come back
+        table: TranspositionTable = {0b001000001 | 0b000001000 << 9: GameStatus.DRAW}
+
+        assert StandardGameEngine(table).check_game_status(game) == GameStatus.DRAW